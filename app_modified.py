@@ -1,9 +1,16 @@
 import streamlit as st
+from streamlit.runtime import Runtime
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
 import sys
 import asyncio
+import concurrent.futures
 import os
 import re
 import logging
+import logging.handlers
+import hashlib
+import json
+import threading
 from dotenv import load_dotenv
 from datetime import date
 
@@ -31,21 +38,44 @@ load_dotenv()
 
 
 
-# Handle Windows asyncio policy
-if sys.platform == "win32":
+# Handle Windows asyncio policy (once per process; Streamlit re-executes this module on rerun)
+if sys.platform == "win32" and not isinstance(
+    asyncio.get_event_loop_policy(), asyncio.WindowsProactorEventLoopPolicy
+):
     asyncio.set_event_loop_policy(asyncio.WindowsProactorEventLoopPolicy())
 
-# Configure logging
+# Configure logging; debug payloads go to the rotating file only, the console gets INFO and up
+_console_handler = logging.StreamHandler()
+_console_handler.setLevel(logging.INFO)
 logging.basicConfig(
     level=logging.DEBUG,
     format='%(asctime)s - %(levelname)s - %(message)s',
     handlers=[
-        logging.StreamHandler(),
-        logging.FileHandler('app_debug.log')
+        _console_handler,
+        logging.handlers.RotatingFileHandler(
+            'app_debug.log', maxBytes=5 * 1024 * 1024, backupCount=3
+        )
     ]
 )
 logger = logging.getLogger(__name__)
 
+# Set DEBUG=1 to show raw model actions and DOM details in the page
+DEBUG = os.environ.get("DEBUG", "").lower() in ("1", "true", "yes")
+
+# Patterns used to pull XPaths out of the browser agent history
+_XPATH_RE = re.compile(r"xpath='([^']+)'")
+_XPATH_CONTENT_RE = re.compile(r"The xpath of the element is (.+)")
+_ELEMENT_IDX_RE = re.compile(r"element (\d+)")
+
+# Feature title in a Gherkin document
+_FEATURE_RE = re.compile(r"Feature:\s*(.+?)(?:\n|$)", re.MULTILINE)
+
+# Model actions that target an element by index
+_ACTION_KEYS = ("input_text", "click_element", "perform_element_action")
+
+# Start of each (possibly indented) "Scenario:" line in a Gherkin document
+_SCENARIO_START_RE = re.compile(r"(?m)^[ \t]*Scenario:")
+
 # Dictionary mapping framework names to their generation functions
 FRAMEWORK_GENERATORS = {
     "Selenium + PyTest BDD (Python)": generate_selenium_pytest_bdd,
@@ -64,6 +94,15 @@ FRAMEWORK_EXTENSIONS = {
     "Selenium + Cucumber (Java)": "java",
 }
 
+# Dictionary mapping framework names to their syntax-highlighting language
+FRAMEWORK_LANGUAGES = {
+    "Selenium + PyTest BDD (Python)": "python",
+    "Playwright (Python)": "python",
+    "Cypress (JavaScript)": "javascript",
+    "Robot Framework": "robot",
+    "Selenium + Cucumber (Java)": "java",
+}
+
 # Framework descriptions
 framework_descriptions = {
     "Selenium + PyTest BDD (Python)": "Popular Python testing framework combining Selenium WebDriver with PyTest BDD for behavior-driven development. Best for Python developers who want strong test organization and reporting.",
@@ -73,290 +112,8 @@ framework_descriptions = {
     "Selenium + Cucumber (Java)": "Robust combination of Selenium WebDriver with Cucumber for Java, supporting BDD. Ideal for Java teams and enterprise applications.",
 }
 
-async def execute_test(steps: str):
-    try:
-        logger.debug(f"Starting test execution with steps:\n{steps}")
-        browser = Browser()
-
-        async with await browser.new_context() as context:
-            logger.debug("Browser context created successfully")
-            # Parse the Gherkin content to extract scenarios
-            scenarios = []
-            current_scenario = []
-            for line in steps.split("\n"):
-                if line.strip().startswith("Scenario:"):
-                    if current_scenario:
-                        scenarios.append("\n".join(current_scenario))
-                    current_scenario = [line]
-                elif current_scenario:
-                    current_scenario.append(line)
-            if current_scenario:
-                scenarios.append("\n".join(current_scenario))
-
-            # Execute each scenario separately
-            all_results = []
-            all_actions = []
-            all_extracted_content = []
-            element_xpath_map = {}
-
-            for scenario in scenarios:
-                logger.debug(f"Executing scenario:\n{scenario}")
-                browser_agent = BrowserAgent(
-                    task=generate_browser_task(scenario),
-                    llm=ChatGoogleGenerativeAI(
-                        model="gemini-2.0-flash",
-                        api_key=os.environ.get("GOOGLE_API_KEY"),
-                    ),
-                    browser=browser,
-                    controller=controller,
-                )
-
-                # Execute and collect results
-                logger.debug("Running browser agent")
-                history = await browser_agent.run()
-                logger.debug(f"Browser agent execution completed. Actions: {len(history.model_actions())}")
-                result = history.final_result()
-                if isinstance(result, str):
-                    # Convert string result to JSON format
-                    result = {
-                        "status": result,
-                        "details": "Execution completed",
-                    }
-                all_results.append(result)
-
-                # Log all model actions for debugging
-                st.write("Debug - Model Actions:", history.model_actions())
-
-                # Process model actions to extract element details
-                for i, action_data in enumerate(history.model_actions()):
-                    action_name = (
-                        history.action_names()[i]
-                        if i < len(history.action_names())
-                        else "Unknown Action"
-                    )
-
-                    # Create a detail record for each action
-                    action_detail = {
-                        "name": action_name,
-                        "index": i,
-                        "element_details": {},
-                    }
-
-                    # Check if this is a get_xpath_of_element action
-                    if "get_xpath_of_element" in action_data:
-                        element_index = action_data[
-                            "get_xpath_of_element"
-                        ].get("index")
-                        action_detail["element_details"][
-                            "index"
-                        ] = element_index
-
-                        # Check if the interacted_element field contains XPath information
-                        if (
-                            "interacted_element" in action_data
-                            and action_data["interacted_element"]
-                        ):
-                            element_info = action_data["interacted_element"]
-
-                            # Extract XPath from the DOMHistoryElement string
-                            xpath_match = re.search(
-                                r"xpath='([^']+)'", str(element_info)
-                            )
-                            if xpath_match:
-                                xpath = xpath_match.group(1)
-                                element_xpath_map[element_index] = xpath
-                                action_detail["element_details"][
-                                    "xpath"
-                                ] = xpath
-
-                    # Check if this is an action on an element
-                    elif any(
-                        key in action_data
-                        for key in [
-                            "input_text",
-                            "click_element",
-                            "perform_element_action",
-                        ]
-                    ):
-                        # Find the action parameters
-                        for key in [
-                            "input_text",
-                            "click_element",
-                            "perform_element_action",
-                        ]:
-                            if key in action_data:
-                                action_params = action_data[key]
-                                if "index" in action_params:
-                                    element_index = action_params["index"]
-                                    action_detail["element_details"][
-                                        "index"
-                                    ] = element_index
-
-                                    # If we have already captured the XPath for this element, add it
-                                    if element_index in element_xpath_map:
-                                        action_detail["element_details"][
-                                            "xpath"
-                                        ] = element_xpath_map[element_index]
-
-                                    # Also check interacted_element
-                                    if (
-                                        "interacted_element" in action_data
-                                        and action_data[
-                                            "interacted_element"
-                                        ]
-                                    ):
-                                        element_info = action_data[
-                                            "interacted_element"
-                                        ]
-                                        xpath_match = re.search(
-                                            r"xpath='([^']+)'",
-                                            str(element_info),
-                                        )
-                                        if xpath_match:
-                                            xpath = xpath_match.group(1)
-                                            element_xpath_map[
-                                                element_index
-                                            ] = xpath
-                                            action_detail[
-                                                "element_details"
-                                            ]["xpath"] = xpath
-
-                    all_actions.append(action_detail)
-
-                # Also extract from content if available
-                for content in history.extracted_content():
-                    all_extracted_content.append(content)
-
-                    # Look for XPath information in extracted content
-                    if isinstance(content, str):
-                        xpath_match = re.search(
-                            r"The xpath of the element is (.+)", content
-                        )
-                        if xpath_match:
-                            xpath = xpath_match.group(1)
-                            # Try to match with an element index from previous actions
-                            index_match = re.search(
-                                r"element (\d+)", content
-                            )
-                            if index_match:
-                                element_index = int(index_match.group(1))
-                                element_xpath_map[element_index] = xpath
-
-            # Save combined history to session state
-            st.session_state.history = {
-                "urls": history.urls(),
-                "action_names": history.action_names(),
-                "detailed_actions": all_actions,
-                "element_xpaths": element_xpath_map,
-                "extracted_content": all_extracted_content,
-                "errors": history.errors(),
-                "model_actions": history.model_actions(),
-                "execution_date": st.session_state.get(
-                    "execution_date", "Unknown"
-                ),
-            }
-
-            # Display test execution details
-            st.markdown(
-                '<div class="status-success fade-in">Test execution completed!</div>',
-                unsafe_allow_html=True,
-            )
-
-            # Display key information in tabs
-            st.markdown(
-                '<div class="tab-container fade-in">',
-                unsafe_allow_html=True,
-            )
-            tab1, tab2, tab3, tab4 = st.tabs(
-                ["Results", "Actions", "Elements", "Details"]
-            )
-            with tab1:
-                for i, result in enumerate(all_results):
-                    st.markdown(
-                        f'<h4 class="glow-text">Scenario {i+1}</h4>',
-                        unsafe_allow_html=True,
-                    )
-                    st.json(result)
-
-            with tab2:
-                st.markdown(
-                    '<h4 class="glow-text">Actions Performed</h4>',
-                    unsafe_allow_html=True,
-                )
-                for i, action in enumerate(all_actions):
-                    action_text = f"{i+1}. {action['name']}"
-                    if (
-                        "element_details" in action
-                        and action["element_details"]
-                    ):
-                        if "xpath" in action["element_details"]:
-                            action_text += f" (XPath: {action['element_details']['xpath']})"
-                        elif "index" in action["element_details"]:
-                            action_text += f" (Element index: {action['element_details']['index']})"
-                    st.write(action_text)
-
-            with tab3:
-                st.markdown(
-                    '<h4 class="glow-text">Element Details</h4>',
-                    unsafe_allow_html=True,
-                )
-                if element_xpath_map:
-                    # Create a dataframe for better visualization
-                    import pandas as pd
-
-                    element_df = pd.DataFrame(
-                        [
-                            {"Element Index": index, "XPath": xpath}
-                            for index, xpath in element_xpath_map.items()
-                        ]
-                    )
-                    st.dataframe(element_df)
-                else:
-                    st.info(
-                        "No element XPaths were captured during test execution."
-                    )
-
-                    # Display raw DOM information for debugging
-                    st.markdown(
-                        '<h4 class="glow-text">Raw DOM Information</h4>',
-                        unsafe_allow_html=True,
-                    )
-                    for i, action_data in enumerate(
-                        history.model_actions()
-                    ):
-                        if (
-                            "interacted_element" in action_data
-                            and action_data["interacted_element"]
-                        ):
-                            st.write(
-                                f"Action {i}: {history.action_names()[i] if i < len(history.action_names()) else 'Unknown'}"
-                            )
-                            st.code(str(action_data["interacted_element"]))
-
-            with tab4:
-                st.markdown(
-                    '<h4 class="glow-text">Extracted Content</h4>',
-                    unsafe_allow_html=True,
-                )
-                for content in all_extracted_content:
-                    st.write(content)
-            st.markdown("</div>", unsafe_allow_html=True)
-
-    except Exception as e:
-        logger.error(f"Test execution failed: {str(e)}", exc_info=True)
-        st.markdown(
-            f'<div class="status-error">An error occurred during test execution: {str(e)}</div>',
-            unsafe_allow_html=True,
-        )
-
-def main():
-    logger.debug("Starting SDET-GENIE application")
-
-    st.set_page_config(page_title="SDET-GENIE", layout="wide")
-
-    # Apply custom CSS
-    st.markdown(
-        """
+# Static page markup, kept out of main() so the layout code stays readable
+_CSS = """
     <style>
         .button-container {
             display: flex;
@@ -401,166 +158,660 @@ def main():
         .user-story {
             margin: 0;
         }
+        .stDownloadButton {
+            display: flex;
+            justify-content: center;
+        }
     </style>
-    """,
-        unsafe_allow_html=True,
-    )
-    
-    st.markdown('<section class="all-container">', unsafe_allow_html=True)
+    """
 
-    # Custom Header
-    st.markdown(
-        '<div class="header fade-in" style="padding-top: 20px;"><span class="header-item">AI Agents powered by AGNO and BROWSER-USE</span></div>',
-        unsafe_allow_html=True,
-    )
+_HEADER_HTML = '<div class="header fade-in" style="padding-top: 20px;"><span class="header-item">AI Agents powered by AGNO and BROWSER-USE</span></div>'
+_TITLE_HTML = '<h1 class="main-title fade-in">SDET - GENIE</h1>'
+_SUBTITLE_HTML = '<p class="subtitle fade-in">User Stories to Automated Tests : The Future of QA Automation using AI Agents</p>'
 
-    # Main Title with custom styling
-    st.markdown(
-        '<h1 class="main-title fade-in">SDET - GENIE</h1>', unsafe_allow_html=True
-    )
-    st.markdown(
-        '<p class="subtitle fade-in">User Stories to Automated Tests : The Future of QA Automation using AI Agents</p>',
-        unsafe_allow_html=True,
+_CONTACT_EMAIL = "richardsongunde@waigenie.tech"
+_CONTACT_BUTTON_HTML = f'<a href="https://mail.google.com/mail/?view=cm&fs=1&to={_CONTACT_EMAIL}" target="_blank"><button style="width: 100%; background: rgba(81, 162, 255); color: white; padding: 0.6rem 1.2rem; border: none; border-radius: 8px; cursor: pointer; font-weight: 600; transition: all 0.3s ease;">Contact Us</button></a>'
+_BRANDING_HTML = """
+            <div style="text-align: center; margin-top: 30px;">
+                <img src="https://www.waigenie.tech/logo.png" style="width: 96px; height: auto; margin-bottom: 10px;">
+                <img src="https://www.waigenie.tech/logotext.svg" style="width: 180px; height: auto; display: block; margin: 0 auto;">
+                <p style="font-size: 0.75rem; color: #E6E6FA; margin-top: 10px;">© 2025 www.waigenie.tech. All rights reserved.</p>
+            </div>
+            """
+
+_FOOTER_HTML = '<div class="footer fade-in">© 2024 www.waigenie.tech | AI-Powered Test Automation</div></section>'
+
+_YOUTUBE_URL = "https://youtu.be/qH30GvQebqg?feature=shared"
+_YOUTUBE_BUTTON_HTML = f'<a href="{_YOUTUBE_URL}" target="_blank"><button style="width: 100%; background: rgb(255, 44, 54); color: white; padding: 0.6rem 1.2rem; border: none; border-radius: 8px; cursor: pointer; font-weight: 600; transition: all 0.3s ease;">▶️  YouTube Demo</button></a>'
+
+# Upper bound on scenarios driven by the browser agent at the same time;
+# at least 1, since a zero-slot semaphore would never let a scenario start
+try:
+    MAX_PARALLEL_SCENARIOS = max(1, int(os.environ.get("MAX_PARALLEL_SCENARIOS", "3")))
+except ValueError:
+    logger.warning("Ignoring non-integer MAX_PARALLEL_SCENARIOS, using 3")
+    MAX_PARALLEL_SCENARIOS = 3
+
+
+def _extract_xpath(action_data):
+    element_info = action_data.get("interacted_element")
+    if not element_info:
+        return None
+    # DOMHistoryElement exposes the XPath directly; avoid rendering it to a string
+    xpath = getattr(element_info, "xpath", None)
+    if xpath:
+        return xpath
+    # Fall back to parsing the string form (e.g. when history was loaded as plain data)
+    element_str = str(element_info)
+    xpath_match = _XPATH_RE.search(element_str)
+    return xpath_match.group(1) if xpath_match else None
+
+
+def _action_suffix(action):
+    # XPath when known, otherwise the element index the action targeted
+    element_details = action.get("element_details")
+    if not element_details:
+        return ""
+    if "xpath" in element_details:
+        return f" (XPath: {element_details['xpath']})"
+    if "index" in element_details:
+        return f" (Element index: {element_details['index']})"
+    return ""
+
+
+@st.cache_data(show_spinner=False, ttl=3600, max_entries=32)
+def _cached_gherkin(prompt: str) -> str:
+    # Identical user stories produce identical prompts, so skip the LLM round-trip
+    return qa_agent.run(prompt).content
+
+
+@st.cache_data(show_spinner=False, ttl=3600, max_entries=32)
+def _cached_generate(framework: str, steps: str, history_key: str, _history: dict) -> str:
+    # Keyed on framework, steps and the history digest from execute_test; the
+    # history itself holds DOM objects Streamlit can't hash, hence the underscore
+    return FRAMEWORK_GENERATORS[framework](steps, _history)
+
+
+@st.cache_data(show_spinner=False, ttl=3600, max_entries=32)
+def _feature_name(steps: str) -> str:
+    # File-name friendly feature title, used for the download file name
+    feature_match = _FEATURE_RE.search(steps)
+    if feature_match:
+        return feature_match.group(1).strip().replace(" ", "_").lower()
+    return "automated_test"
+
+
+# How often a session loop checks whether its Streamlit session is still connected
+_SESSION_CHECK_INTERVAL = 30
+
+
+def _run_loop(loop, started):
+    asyncio.set_event_loop(loop)
+    loop.call_soon(started.set)
+    loop.run_forever()
+    loop.close()
+
+
+async def _watch_session(session_id, browser):
+    # Close the browser and stop this loop once Streamlit has dropped the
+    # session; two misses in a row so a brief reconnect doesn't tear it down
+    if not Runtime.exists():
+        return
+    misses = 0
+    while misses < 2:
+        await asyncio.sleep(_SESSION_CHECK_INTERVAL)
+        if Runtime.instance().is_active_session(session_id):
+            misses = 0
+        else:
+            misses += 1
+    logger.debug("Session %s ended, closing its browser", session_id)
+    # Cancel any run still in flight so its future resolves instead of being
+    # dropped with the loop
+    current = asyncio.current_task()
+    pending = [t for t in asyncio.all_tasks() if t is not current]
+    for task in pending:
+        task.cancel()
+    await asyncio.gather(*pending, return_exceptions=True)
+    try:
+        await browser.close()
+    except Exception:
+        logger.warning("Failed to close browser for session %s", session_id, exc_info=True)
+    asyncio.get_running_loop().stop()
+
+
+def _get_loop():
+    # Long-lived event loop per session, driven by a daemon thread, so the
+    # browser and HTTP sessions opened on it survive across clicks. The loop
+    # owns the session's browser and shuts both down when the session ends.
+    loop = st.session_state.get("loop")
+    thread = st.session_state.get("loop_thread")
+    # A stopped loop may not be closed yet; work submitted to it would never run
+    if loop is None or not loop.is_running() or not thread.is_alive():
+        loop = asyncio.new_event_loop()
+        browser = Browser()
+        started = threading.Event()
+        thread = threading.Thread(target=_run_loop, args=(loop, started), daemon=True)
+        thread.start()
+        # Wait until the loop is running so the next call doesn't replace it again
+        started.wait()
+        asyncio.run_coroutine_threadsafe(
+            _watch_session(get_script_run_ctx().session_id, browser), loop
+        )
+        st.session_state.loop = loop
+        st.session_state.loop_thread = thread
+        st.session_state.browser = browser
+        # The model's async client binds to the loop that first uses it, so it
+        # is replaced along with the loop
+        st.session_state.llm = ChatGoogleGenerativeAI(
+            model="gemini-2.0-flash",
+            api_key=os.environ.get("GOOGLE_API_KEY"),
+        )
+    return loop
+
+
+def _run_on_loop(coro):
+    loop = _get_loop()
+    # Let Streamlit calls made inside the coroutine render into this script run
+    add_script_run_ctx(st.session_state.loop_thread, get_script_run_ctx())
+    future = asyncio.run_coroutine_threadsafe(coro, loop)
+    # Streamlit only raises its stop/rerun exceptions on the script thread when
+    # that thread sends something to the page, so poll and touch a placeholder
+    heartbeat = st.empty()
+    try:
+        while True:
+            try:
+                return future.result(timeout=0.5)
+            except concurrent.futures.TimeoutError:
+                if not st.session_state.loop_thread.is_alive():
+                    raise RuntimeError("The session event loop stopped before the run finished")
+                heartbeat.empty()
+    except BaseException:
+        # Script stopped or rerun while waiting: cancel the work on the loop too
+        future.cancel()
+        raise
+
+
+def _get_browser():
+    # Reuse one browser per session; it is bound to the session's event loop
+    _get_loop()
+    return st.session_state.browser
+
+
+def _get_llm():
+    # Reuse one model client per session instead of building one per scenario
+    _get_loop()
+    return st.session_state.llm
+
+
+def _process_history(history):
+    # Pure parsing of an agent history; safe to run in a worker thread
+    model_actions = history.model_actions()
+    action_names = history.action_names()
+    n_names = len(action_names)
+    logger.debug("Browser agent execution completed. Actions: %d", len(model_actions))
+    result = history.final_result()
+    if isinstance(result, str):
+        # Convert string result to JSON format
+        result = {
+            "status": result,
+            "details": "Execution completed",
+        }
+
+    actions = []
+    extracted_content = []
+    element_xpath_map = {}
+    # (action index, action name, element) for the raw DOM fallback view
+    raw_dom_rows = []
+
+    # Process model actions to extract element details
+    for i, action_data in enumerate(model_actions):
+        action_name = action_names[i] if i < n_names else "Unknown Action"
+
+        # Create a detail record for each action
+        action_detail = {
+            "name": action_name,
+            "index": i,
+            "element_details": {},
+        }
+
+        element_info = action_data.get("interacted_element")
+        if element_info:
+            raw_dom_rows.append((i, action_name, element_info))
+
+        # Check if this is a get_xpath_of_element action
+        if "get_xpath_of_element" in action_data:
+            element_index = action_data["get_xpath_of_element"].get("index")
+            action_detail["element_details"]["index"] = element_index
+
+            # Check if the interacted_element field contains XPath information
+            xpath = _extract_xpath(action_data)
+            if xpath:
+                element_xpath_map[element_index] = xpath
+                action_detail["element_details"]["xpath"] = xpath
+
+        # Check if this is an action on an element
+        else:
+            hit = next((k for k in _ACTION_KEYS if k in action_data), None)
+            if hit is not None:
+                action_params = action_data[hit]
+                if "index" in action_params:
+                    element_index = action_params["index"]
+                    action_detail["element_details"]["index"] = element_index
+
+                    # Indices are renumbered on every page, so prefer the XPath of
+                    # the element this action actually hit
+                    xpath = _extract_xpath(action_data)
+                    if xpath:
+                        element_xpath_map[element_index] = xpath
+                        action_detail["element_details"]["xpath"] = xpath
+                    elif element_index in element_xpath_map:
+                        # Otherwise fall back to an XPath captured earlier
+                        action_detail["element_details"][
+                            "xpath"
+                        ] = element_xpath_map[element_index]
+
+        actions.append(action_detail)
+
+    # Also extract from content if available
+    for content in history.extracted_content():
+        extracted_content.append(content)
+
+        # Look for XPath information in extracted content
+        if isinstance(content, str):
+            xpath_match = _XPATH_CONTENT_RE.search(content)
+            if xpath_match:
+                xpath = xpath_match.group(1)
+                # Try to match with an element index from previous actions
+                index_match = _ELEMENT_IDX_RE.search(content)
+                if index_match:
+                    element_index = int(index_match.group(1))
+                    element_xpath_map[element_index] = xpath
+
+    return (
+        result,
+        actions,
+        extracted_content,
+        element_xpath_map,
+        raw_dom_rows,
+        model_actions,
+        action_names,
     )
-    # Sidebar styling
-    with st.sidebar:
+
+
+async def _run_scenario(
+    scenario: str,
+    browser: Browser,
+    llm: ChatGoogleGenerativeAI,
+    semaphore: asyncio.Semaphore,
+):
+    async with semaphore:
+        logger.debug("Executing scenario:\n%s", scenario)
+        # Each scenario gets its own context so parallel runs don't share tabs
+        async with await browser.new_context() as context:
+            browser_agent = BrowserAgent(
+                task=generate_browser_task(scenario),
+                llm=llm,
+                browser=browser,
+                browser_context=context,
+                controller=controller,
+            )
+
+            # Execute and collect results
+            logger.debug("Running browser agent")
+            history = await browser_agent.run()
+
+    # Parse the history off the event loop so other scenarios keep running
+    processed = await asyncio.to_thread(_process_history, history)
+    model_actions = processed[5]
+
+    # Log all model actions for debugging
+    if DEBUG:
+        st.write("Debug - Model Actions:", model_actions)
+
+    return (history, *processed)
+
+
+def _render_scenario_results(all_results):
+    for i, result in enumerate(all_results):
         st.markdown(
-            '<div class="sidebar-heading"><a href="https://www.waigenie.tech/" target="_blank" style="color: white; text-decoration: none;">WAIGENIE</a></div>',
+            f'<h4 class="glow-text">Scenario {i+1}</h4>',
             unsafe_allow_html=True,
         )
+        st.json(result)
+
 
+async def execute_test(
+    steps: str,
+    browser: Browser = None,
+    max_parallel: int = MAX_PARALLEL_SCENARIOS,
+):
+    try:
+        logger.debug("Starting test execution with steps:\n%s", steps)
+        if browser is None:
+            browser = Browser()
+
+        # Parse the Gherkin content to extract scenarios
+        # Slice steps between scenario starts; no per-line lists or joins
+        starts = [m.start() for m in _SCENARIO_START_RE.finditer(steps)]
+        ends = starts[1:] + [len(steps)]
+        scenarios = [steps[a:b].rstrip() for a, b in zip(starts, ends)]
+        if not scenarios:
+            st.markdown(
+                '<div class="status-error">No "Scenario:" blocks were found in the Gherkin steps.</div>',
+                unsafe_allow_html=True,
+            )
+            return
+
+        # Launch Playwright once up front; browser_use launches it lazily without
+        # a lock, so concurrent new_context() calls would each start a Chromium
+        await browser.get_playwright_browser()
+
+        # Execute scenarios concurrently, capped to avoid LLM rate limits
+        llm = _get_llm()
+        semaphore = asyncio.Semaphore(max(1, max_parallel))
+
+        # Report progress as each scenario finishes rather than only at the end
+        progress = st.empty()
+        completed = 0
+        recorded_actions = 0
+
+        async def _tracked(scenario):
+            nonlocal completed, recorded_actions
+            try:
+                outcome = await _run_scenario(scenario, browser, llm, semaphore)
+                recorded_actions += len(outcome[2])
+                return outcome
+            finally:
+                completed += 1
+                progress.info(
+                    f"Completed {completed} of {len(scenarios)} scenarios "
+                    f"({recorded_actions} actions recorded)"
+                )
+
+        tasks = [_tracked(s) for s in scenarios]
+        outcomes = await asyncio.gather(*tasks, return_exceptions=True)
+        progress.empty()
+
+        all_results = []
+        detailed_actions = []
+        all_extracted_content = []
+        element_xpath_map = {}
+        raw_dom_rows = []
+        history = None
+        model_actions = []
+        action_names = []
+
+        for i, outcome in enumerate(outcomes):
+            if isinstance(outcome, Exception):
+                logger.error("Scenario %d failed: %s", i + 1, outcome, exc_info=outcome)
+                all_results.append({"status": "error", "details": str(outcome)})
+                continue
+            (
+                history,
+                result,
+                actions,
+                extracted_content,
+                xpath_map,
+                dom_rows,
+                model_actions,
+                action_names,
+            ) = outcome
+            all_results.append(result)
+            detailed_actions.extend(actions)
+            all_extracted_content.extend(extracted_content)
+            element_xpath_map.update(xpath_map)
+            raw_dom_rows.extend(dom_rows)
+
+        if history is None:
+            # Every scenario failed: still show why, scenario by scenario
+            st.markdown(
+                '<div class="status-error">All scenarios failed. See the results below.</div>'
+                '<div class="tab-container fade-in">',
+                unsafe_allow_html=True,
+            )
+            (results_tab,) = st.tabs(["Results"])
+            with results_tab:
+                _render_scenario_results(all_results)
+            st.markdown("</div>", unsafe_allow_html=True)
+            return
+
+        # Save combined history to session state
+        st.session_state.history = {
+            "urls": history.urls(),
+            "action_names": action_names,
+            "detailed_actions": detailed_actions,
+            "element_xpaths": element_xpath_map,
+            "extracted_content": all_extracted_content,
+            "errors": history.errors(),
+            "model_actions": model_actions,
+            "execution_date": st.session_state.get(
+                "execution_date", "Unknown"
+            ),
+        }
+        # Digest the history once per execution; code generation keys its caches on it
+        st.session_state.history_key = hashlib.blake2b(
+            json.dumps(
+                st.session_state.history, sort_keys=True, default=str
+            ).encode(),
+            digest_size=16,
+        ).hexdigest()
+
+        # Display test execution details
         st.markdown(
-            '<div class="sidebar-heading">Avilable Frameworks</div>',
+            '<div class="status-success fade-in">Test execution completed!</div>',
             unsafe_allow_html=True,
         )
-        selected_framework = st.selectbox(
-            "Select framework:", list(FRAMEWORK_GENERATORS.keys()), index=0
-        )
-        # New About WaiGenie section with tabs
-        with st.expander("About WaiGenie"):
-            tab1, tab2, tab3, tab4, tab5 = st.tabs(
-                ["Vision & Mission", "Features", "How It Works", "Workflow", "Benefits"]
-            )
 
-            with tab1:
-                st.subheader("Our Vision")
-                st.write(
-                    "Revolutionizing Quality Assurance with AI-powered solutions that empower teams to deliver flawless software at unprecedented speeds."
-                )
+        # Display key information in tabs
+        st.markdown(
+            '<div class="tab-container fade-in">',
+            unsafe_allow_html=True,
+        )
+        tab1, tab2, tab3, tab4 = st.tabs(
+            ["Results", "Actions", "Elements", "Details"]
+        )
+        with tab1:
+            _render_scenario_results(all_results)
 
-                st.subheader("Our Mission")
-                st.write(
-                    "Empower QA teams with cutting-edge AI solutions tailored for enterprise needs, enabling them to deliver high-quality software faster and more efficiently than ever before."
+        with tab2:
+            st.markdown(
+                '<h4 class="glow-text">Actions Performed</h4>',
+                unsafe_allow_html=True,
+            )
+            # Render all actions as one markdown list instead of one element per action
+            lines = [
+                f"{i+1}. {action['name']}{_action_suffix(action)}"
+                for i, action in enumerate(
+                    st.session_state.history["detailed_actions"]
                 )
+            ]
+            st.markdown("\n".join(lines))
 
-            with tab2:
-                st.markdown("#### 🧠 AI-Powered Test Generation")
-                st.write(
-                    "Generate comprehensive test scenarios using advanced AI algorithms."
-                )
-                st.markdown("#### 🔍 Intelligent Element Inspector")
-                st.write(
-                    "Automatically identify and analyze web elements with precision."
-                )
-                st.markdown("#### 📝 Gherkin Feature Generator")
-                st.write(
-                    "Transform user stories into clear, concise Gherkin feature files."
-                )
-                st.markdown("#### 💻 Automated Code Generation")
-                st.write(
-                    "Generate test automation scripts in multiple languages automatically."
-                )
-                st.markdown("#### 🤖 Web Agent Explorer")
-                st.write(
-                    "Leverage AI to automatically explore and test complex user journeys."
+        with tab3:
+            st.markdown(
+                '<h4 class="glow-text">Element Details</h4>',
+                unsafe_allow_html=True,
+            )
+            if element_xpath_map:
+                # Create a dataframe for better visualization
+                st.dataframe(
+                    {
+                        "Element Index": list(element_xpath_map.keys()),
+                        "XPath": list(element_xpath_map.values()),
+                    }
                 )
-                st.markdown("#### 📊 Advanced Analytics")
-                st.write(
-                    "Gain insights into your testing processes and identify areas for improvement."
+            else:
+                st.info(
+                    "No element XPaths were captured during test execution."
                 )
 
-            with tab3:
-                col1, col2 = st.columns([1, 5])
-                with col1:
-                    st.markdown("### 1")
-                with col2:
-                    st.markdown("#### Sign Up")
-                    st.write(
-                        "Create your WaiGenie account and set up your organization profile."
-                    )
-                col1, col2 = st.columns([1, 5])
-                with col1:
-                    st.markdown("### 2")
-                with col2:
-                    st.markdown("#### Connect")
-                    st.write(
-                        "Integrate WaiGenie with your existing QA tools and workflows."
-                    )
-                col1, col2 = st.columns([1, 5])
-                with col1:
-                    st.markdown("### 3")
-                with col2:
-                    st.markdown("#### Analyze")
-                    st.write(
-                        "Let our AI analyze your application and generate test scenarios."
-                    )
-                col1, col2 = st.columns([1, 5])
-                with col1:
-                    st.markdown("### 4")
-                with col2:
-                    st.markdown("#### Optimize")
-                    st.write(
-                        "Continuously improve your QA process with AI-driven insights."
+                # Display raw DOM information for debugging
+                if DEBUG:
+                    st.markdown(
+                        '<h4 class="glow-text">Raw DOM Information</h4>',
+                        unsafe_allow_html=True,
                     )
+                    for i, action_name, element_info in raw_dom_rows:
+                        st.write(f"Action {i}: {action_name}")
+                        st.code(str(element_info))
 
-            with tab4:
-                st.subheader("AI-Powered QA Workflow")
-                st.markdown("#### 1. QA Agent")
-                st.write("• Converts user stories into Gherkin scenarios")
-                st.write("• Generates positive and negative test cases")
-                st.markdown("#### 2. Browser Agent")
-                st.write("• Executes Gherkin scenarios in a browser")
-                st.write("• Captures detailed DOM information")
-                st.write("• Records element details like XPaths")
-                st.markdown("#### 3. Code Generation Agent")
-                st.write("• Transforms scenarios into automation scripts")
-                st.write("• Includes necessary imports and dependencies")
-                st.write("• Handles errors and provides helper functions")
-
-            with tab5:
-                st.write("• 90% reduction in time-to-test")
-                st.write("• Enhanced test coverage")
-                st.write("• Consistent code implementation")
-                st.write("• Lower maintenance overhead")
-                st.write("• Bridges skill gaps")
-                st.write("• Preserves testing knowledge")
-            # Add contact button and separator
-            st.markdown("---")
-            email = "richardsongunde@waigenie.tech"
-            gmail_link = f"https://mail.google.com/mail/?view=cm&fs=1&to={email}"
+        with tab4:
             st.markdown(
-                f'<a href="{gmail_link}" target="_blank"><button style="width: 100%; background: rgba(81, 162, 255); color: white; padding: 0.6rem 1.2rem; border: none; border-radius: 8px; cursor: pointer; font-weight: 600; transition: all 0.3s ease;">Contact Us</button></a>',
+                '<h4 class="glow-text">Extracted Content</h4>',
                 unsafe_allow_html=True,
             )
-            # Add logo and branding at the bottom
-            st.markdown(
-                """
-            <div style="text-align: center; margin-top: 30px;">
-                <img src="https://www.waigenie.tech/logo.png" style="width: 96px; height: auto; margin-bottom: 10px;">
-                <img src="https://www.waigenie.tech/logotext.svg" style="width: 180px; height: auto; display: block; margin: 0 auto;">
-                <p style="font-size: 0.75rem; color: #E6E6FA; margin-top: 10px;">© 2025 www.waigenie.tech. All rights reserved.</p>
-            </div>
-            """,
-                unsafe_allow_html=True,
+            st.markdown("\n\n".join(str(content) for content in all_extracted_content))
+        st.markdown("</div>", unsafe_allow_html=True)
+
+    except Exception as e:
+        logger.error("Test execution failed: %s", e, exc_info=True)
+        st.markdown(
+            f'<div class="status-error">An error occurred during test execution: {str(e)}</div>',
+            unsafe_allow_html=True,
+        )
+
+
+def _render_about_waigenie():
+    tab1, tab2, tab3, tab4, tab5 = st.tabs(
+        ["Vision & Mission", "Features", "How It Works", "Workflow", "Benefits"]
+    )
+
+    with tab1:
+        st.subheader("Our Vision")
+        st.write(
+            "Revolutionizing Quality Assurance with AI-powered solutions that empower teams to deliver flawless software at unprecedented speeds."
+        )
+
+        st.subheader("Our Mission")
+        st.write(
+            "Empower QA teams with cutting-edge AI solutions tailored for enterprise needs, enabling them to deliver high-quality software faster and more efficiently than ever before."
+        )
+
+    with tab2:
+        st.markdown("#### 🧠 AI-Powered Test Generation")
+        st.write(
+            "Generate comprehensive test scenarios using advanced AI algorithms."
+        )
+        st.markdown("#### 🔍 Intelligent Element Inspector")
+        st.write(
+            "Automatically identify and analyze web elements with precision."
+        )
+        st.markdown("#### 📝 Gherkin Feature Generator")
+        st.write(
+            "Transform user stories into clear, concise Gherkin feature files."
+        )
+        st.markdown("#### 💻 Automated Code Generation")
+        st.write(
+            "Generate test automation scripts in multiple languages automatically."
+        )
+        st.markdown("#### 🤖 Web Agent Explorer")
+        st.write(
+            "Leverage AI to automatically explore and test complex user journeys."
+        )
+        st.markdown("#### 📊 Advanced Analytics")
+        st.write(
+            "Gain insights into your testing processes and identify areas for improvement."
+        )
+
+    with tab3:
+        col1, col2 = st.columns([1, 5])
+        with col1:
+            st.markdown("### 1")
+        with col2:
+            st.markdown("#### Sign Up")
+            st.write(
+                "Create your WaiGenie account and set up your organization profile."
+            )
+        col1, col2 = st.columns([1, 5])
+        with col1:
+            st.markdown("### 2")
+        with col2:
+            st.markdown("#### Connect")
+            st.write(
+                "Integrate WaiGenie with your existing QA tools and workflows."
+            )
+        col1, col2 = st.columns([1, 5])
+        with col1:
+            st.markdown("### 3")
+        with col2:
+            st.markdown("#### Analyze")
+            st.write(
+                "Let our AI analyze your application and generate test scenarios."
+            )
+        col1, col2 = st.columns([1, 5])
+        with col1:
+            st.markdown("### 4")
+        with col2:
+            st.markdown("#### Optimize")
+            st.write(
+                "Continuously improve your QA process with AI-driven insights."
             )
 
-        # Add YouTube demo button
-        youtube_url = "https://youtu.be/qH30GvQebqg?feature=shared"
+    with tab4:
+        st.subheader("AI-Powered QA Workflow")
+        st.markdown("#### 1. QA Agent")
+        st.write("• Converts user stories into Gherkin scenarios")
+        st.write("• Generates positive and negative test cases")
+        st.markdown("#### 2. Browser Agent")
+        st.write("• Executes Gherkin scenarios in a browser")
+        st.write("• Captures detailed DOM information")
+        st.write("• Records element details like XPaths")
+        st.markdown("#### 3. Code Generation Agent")
+        st.write("• Transforms scenarios into automation scripts")
+        st.write("• Includes necessary imports and dependencies")
+        st.write("• Handles errors and provides helper functions")
+
+    with tab5:
+        st.write("• 90% reduction in time-to-test")
+        st.write("• Enhanced test coverage")
+        st.write("• Consistent code implementation")
+        st.write("• Lower maintenance overhead")
+        st.write("• Bridges skill gaps")
+        st.write("• Preserves testing knowledge")
+    # Add contact button and separator
+    st.markdown("---")
+    st.markdown(_CONTACT_BUTTON_HTML, unsafe_allow_html=True)
+    # Add logo and branding at the bottom
+    st.markdown(_BRANDING_HTML, unsafe_allow_html=True)
+
+
+def main():
+    logger.debug("Starting SDET-GENIE application")
+
+    st.set_page_config(page_title="SDET-GENIE", layout="wide")
+
+    # Apply custom CSS
+    st.markdown(_CSS, unsafe_allow_html=True)
+    
+    st.markdown('<section class="all-container">', unsafe_allow_html=True)
+
+    # Custom Header
+    st.markdown(_HEADER_HTML, unsafe_allow_html=True)
+
+    # Main Title with custom styling
+    st.markdown(_TITLE_HTML, unsafe_allow_html=True)
+    st.markdown(_SUBTITLE_HTML, unsafe_allow_html=True)
+    # Sidebar styling
+    with st.sidebar:
         st.markdown(
-            f'<a href="{youtube_url}" target="_blank"><button style="width: 100%; background: rgb(255, 44, 54); color: white; padding: 0.6rem 1.2rem; border: none; border-radius: 8px; cursor: pointer; font-weight: 600; transition: all 0.3s ease;">▶️  YouTube Demo</button></a>',
+            '<div class="sidebar-heading"><a href="https://www.waigenie.tech/" target="_blank" style="color: white; text-decoration: none;">WAIGENIE</a></div>',
             unsafe_allow_html=True,
         )
 
+        st.markdown(
+            '<div class="sidebar-heading">Avilable Frameworks</div>',
+            unsafe_allow_html=True,
+        )
+        selected_framework = st.selectbox(
+            "Select framework:", list(FRAMEWORK_GENERATORS.keys()), index=0
+        )
+        # New About WaiGenie section with tabs
+        with st.expander("About WaiGenie"):
+            _render_about_waigenie()
+
+        # Add YouTube demo button
+        st.markdown(_YOUTUBE_BUTTON_HTML, unsafe_allow_html=True)
+
     # Main content area with card styling
     st.markdown('<div class="text-area-container">', unsafe_allow_html=True)
     # st.markdown('<span style="margin: 0;">Enter User Story</span>', unsafe_allow_html=True)
@@ -592,67 +843,11 @@ def main():
         st.markdown("</div>", unsafe_allow_html=True)
     # Gherkin Generation Section
     if generate_btn and user_story:
-        logger.debug(f"Generating Gherkin scenarios for user story:\n{user_story}")
+        logger.debug("Generating Gherkin scenarios for user story:\n%s", user_story)
         with st.spinner("Generating Gherkin scenarios..."):
             prompt = generate_gherkin_scenarios(user_story)
-            run_response = qa_agent.run(prompt)
-            generated_steps = run_response.content
-            logger.debug(f"Generated Gherkin scenarios:\n{generated_steps}")
-            st.session_state.generated_steps = generated_steps
-
-    # Display editor (moved outside the generate_btn condition)
-    if 'generated_steps' in st.session_state:
-        st.markdown(
-            '<div class="card code-container fade-in">', unsafe_allow_html=True
-        )
-        st.markdown(
-            '<h3 class="glow-text">Generated Gherkin Scenarios</h3>',
-            unsafe_allow_html=True,
-        )
-        
-        # Create a unique key for the text area based on whether we're editing
-        editor_key = f"gherkin_editor_{st.session_state.get('edit_counter', 0)}"
-        
-        # edited_steps = st.text_area(
-        #     "Edit Gherkin",
-        #     value=st.session_state.generated_steps,
-        #     height=300,
-        #     key=editor_key,
-        #     help="You can edit the generated Gherkin scenarios here"
-        # )
-        st.markdown("</div>", unsafe_allow_html=True)
-
-    # if edit_btn:
-    #     if 'generated_steps' in st.session_state:
-    #         # Update the steps with the edited version
-    #         st.session_state.generated_steps = edited_steps
-    #         # Increment edit counter to force text area refresh
-    #         st.session_state.edit_counter = st.session_state.get('edit_counter', 0) + 1
-    #         st.success("Gherkin scenarios updated successfully!")
-    #     else:
-    #         st.error("Please generate Gherkin scenarios first.")
-
-    # Test Execution Section
-    if execute_btn:
-        if "generated_steps" not in st.session_state:
-            st.markdown(
-                '<div class="status-error">Please generate Gherkin scenarios first.</div>',
-                unsafe_allow_html=True,
-            )
-        else:
-            # Use the latest version of the steps from session state
-            current_steps = st.session_state.generated_steps
-            with st.spinner("Executing test steps..."):
-                asyncio.run(execute_test(current_steps))
-
-    # Gherkin Generation Section
-    if generate_btn and user_story:
-        logger.debug(f"Generating Gherkin scenarios for user story:\n{user_story}")
-        with st.spinner("Generating Gherkin scenarios..."):
-            prompt = generate_gherkin_scenarios(user_story)
-            run_response = qa_agent.run(prompt)
-            generated_steps = run_response.content
-            logger.debug(f"Generated Gherkin scenarios:\n{generated_steps}")
+            generated_steps = _cached_gherkin(prompt)
+            logger.debug("Generated Gherkin scenarios:\n%s", generated_steps)
             st.session_state.generated_steps = generated_steps
 
     # Display editor (moved outside the generate_btn condition)
@@ -678,9 +873,8 @@ def main():
 
     if edit_btn:
         if 'generated_steps' in st.session_state:
-            logger.debug(f"Updated Gherkin scenarios:\n{st.session_state.generated_steps}")
+            logger.debug("Updated Gherkin scenarios:\n%s", st.session_state.generated_steps)
             st.success("Gherkin scenarios updated successfully!")
-            print("Updated steps:", st.session_state.generated_steps)
         else:
             logger.warning("Edit button clicked but no scenarios found in session state")
             st.error("Please generate Gherkin scenarios first.")
@@ -694,7 +888,10 @@ def main():
             )
         else:
             st.session_state.execution_date = date.today().strftime("%B %d, %Y")
-            asyncio.run(execute_test(st.session_state.generated_steps))
+            # Use the latest version of the steps from session state
+            current_steps = st.session_state.generated_steps
+            with st.spinner("Executing test steps..."):
+                _run_on_loop(execute_test(current_steps, browser=_get_browser()))
     # Code Generation Section
     if generate_code_btn:
         if (
@@ -708,65 +905,67 @@ def main():
         else:
             with st.spinner(f"Generating {selected_framework} automation code..."):
                 try:
-                    # Get the appropriate generator function
-                    generator_function = FRAMEWORK_GENERATORS[selected_framework]
+                    # Generate automation code, reusing earlier output for identical inputs
+                    history_key = st.session_state.history_key
+                    codegen_key = hashlib.blake2b(
+                        b"\0".join(
+                            (
+                                st.session_state.generated_steps.encode(),
+                                history_key.encode(),
+                                selected_framework.encode(),
+                            )
+                        ),
+                        digest_size=16,
+                    ).digest()
 
-                    # Generate automation code
-                    automation_code = generator_function(
-                        st.session_state.generated_steps, st.session_state.history
-                    )
+                    # Same inputs as the last generation in this session: reuse its output
+                    if (
+                        st.session_state.get("_last_codegen_key") == codegen_key
+                        and "automation_code" in st.session_state
+                    ):
+                        automation_code = st.session_state.automation_code
+                    else:
+                        automation_code = _cached_generate(
+                            selected_framework,
+                            st.session_state.generated_steps,
+                            history_key,
+                            st.session_state.history,
+                        )
 
-                    # Store in session state
-                    st.session_state.automation_code = automation_code
+                        # Store in session state, encoded once for the download button
+                        st.session_state.automation_code = automation_code
+                        st.session_state.automation_code_bytes = automation_code.encode("utf-8")
+                        st.session_state._last_codegen_key = codegen_key
 
                     # Display code
                     st.markdown(
-                        '<div class="card code-container fade-in">',
-                        unsafe_allow_html=True,
-                    )
-                    st.markdown(
+                        '<div class="card code-container fade-in">'
                         f'<h3 class="glow-text">Generated {selected_framework} Automation Code</h3>',
                         unsafe_allow_html=True,
                     )
 
                     # Use appropriate language for syntax highlighting
-                    code_language = "python"
-                    if selected_framework == "Cypress (JavaScript)":
-                        code_language = "javascript"
-                    elif selected_framework == "Robot Framework":
-                        code_language = "robot"
-                    elif selected_framework == "Selenium + Cucumber (Java)":
-                        code_language = "java"
+                    code_language = FRAMEWORK_LANGUAGES.get(selected_framework, "python")
 
                     st.code(automation_code, language=code_language)
-                    st.markdown("</div>", unsafe_allow_html=True)
-
-                    # Extract feature name for file naming
-                    feature_name = "automated_test"
-                    feature_match = re.search(
-                        r"Feature:\s*(.+?)(?:\n|$)", st.session_state.generated_steps
+                    st.markdown(
+                        '</div><div class="status-success fade-in">Automation code generated successfully!</div>',
+                        unsafe_allow_html=True,
                     )
-                    if feature_match:
-                        feature_name = (
-                            feature_match.group(1).strip().replace(" ", "_").lower()
-                        )
 
-                    # Get appropriate file extension
+                    # Extract feature name and file extension for file naming
+                    feature_name = _feature_name(st.session_state.generated_steps)
                     file_ext = FRAMEWORK_EXTENSIONS[selected_framework]
+                    st.session_state.automation_file_name = (
+                        f"{feature_name}_automation.{file_ext}"
+                    )
 
-                    # Add download button
-                    col1, col2, col3 = st.columns([1, 2, 1])
-                    with col2:
-                        st.download_button(
-                            label=f"📥 Download {selected_framework} Code",
-                            data=automation_code,
-                            file_name=f"{feature_name}_automation.{file_ext}",
-                            mime="text/plain",
-                        )
-
-                    st.markdown(
-                        '<div class="status-success fade-in">Automation code generated successfully!</div>',
-                        unsafe_allow_html=True,
+                    # Add download button (centered via the .stDownloadButton rule in _CSS)
+                    st.download_button(
+                        label=f"📥 Download {selected_framework} Code",
+                        data=st.session_state.automation_code_bytes,
+                        file_name=st.session_state.automation_file_name,
+                        mime="text/plain",
                     )
 
                 except Exception as e:
@@ -776,11 +975,7 @@ def main():
                     )
 
     # Footer
-    st.markdown(
-        '<div class="footer fade-in">© 2024 www.waigenie.tech | AI-Powered Test Automation</div>',
-        unsafe_allow_html=True,
-    )
-    st.markdown("</section>", unsafe_allow_html=True)
+    st.markdown(_FOOTER_HTML, unsafe_allow_html=True)
 
 
 if __name__ == "__main__":